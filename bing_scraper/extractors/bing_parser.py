@@ -0,0 +1,877 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
+
+import httpx
+import lxml.html
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from lxml.cssselect import CSSSelector
+
+from bing_scraper.extractors.page_cache import PageCache
+from bing_scraper.extractors.softblock_handler import SoftBlockHandler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENTS = [
+    # A small rotation of common desktop user agents.
+    (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0 Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/605.1.15 (KHTML, like Gecko) "
+        "Version/17.0 Safari/605.1.15"
+    ),
+    (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0 Safari/537.36"
+    ),
+]
+
+# Pre-built per-request header mappings, one per user agent, so rotating the
+# User-Agent does not allocate a new dict on every request.
+_UA_HEADERS = tuple({"User-Agent": ua} for ua in DEFAULT_USER_AGENTS)
+
+# A grouped number such as "30,100", "1.234" or "1 234"; the separators are
+# stripped afterwards by _NON_DIGIT_RE.
+_NUMBER_RE = re.compile(r"\d(?:[\d,.\s]*\d)?")
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# Selectors are compiled to XPath once at import instead of on every page.
+_SEL_RESULTS_COUNT = CSSSelector("#b_tween .sb_count")
+_SEL_ORGANIC = CSSSelector("#b_results li.b_algo")
+_SEL_PAID = CSSSelector("#b_results li.b_ad, #b_results li.b_adresult")
+_SEL_PAID_CITE = CSSSelector("div.b_adurl cite, div.b_attribution cite")
+_SEL_PAA = CSSSelector("#b_context .b_expando")
+_SEL_PAA_PARTS = CSSSelector("div.b_qa div.b_q, div.b_qa div.b_a, div.b_qa a[href]")
+_SEL_LINK = CSSSelector("a[href]")
+_SEL_REL_LIS = CSSSelector("#b_context .b_rs li")
+
+_PARSER_LOCAL = threading.local()
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """
+    Return this thread's cached HTML parser. Dropping whitespace-only text
+    and comments leaves far fewer nodes to build and walk on Bing's markup.
+    lxml parsers must not be shared between threads, hence one per thread.
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_blank_text=True, remove_comments=True)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+_ICON_CLASSES = frozenset({"favicon", "b_primicon"})
+
+def _classes(el: etree._Element) -> List[str]:
+    return (el.get("class") or "").split()
+
+def _text(el: Optional[etree._Element], sep: str = "") -> str:
+    """
+    Collapse the text nodes under ``el`` into a single stripped string,
+    mirroring BeautifulSoup's ``get_text(sep, strip=True)``.
+    """
+    if el is None:
+        return ""
+    return sep.join(piece.strip() for piece in el.itertext() if piece.strip())
+
+def _first(el: etree._Element, selector: CSSSelector) -> Optional[etree._Element]:
+    matches = selector(el)
+    return matches[0] if matches else None
+
+_ACCEPT = (
+    "text/html,application/xhtml+xml,application/xml;"
+    "q=0.9,image/avif,image/webp,*/*;q=0.8"
+)
+
+# Brotli is typically ~20% smaller than gzip on SERP HTML; urllib3 and httpx
+# decode it transparently through brotlicffi.
+_ACCEPT_ENCODING = "gzip, br, deflate"
+
+_DEFAULT_SESSION: Optional[requests.Session] = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+def _build_session(proxy: Optional[str] = None) -> requests.Session:
+    """
+    Build a pooled, keep-alive session: every page and every soft-block retry
+    made through it reuses the same TCP/TLS connections to Bing.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "Accept": _ACCEPT,
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        }
+    )
+    session.headers.update(random.choice(_UA_HEADERS))
+    if proxy:
+        session.proxies.update({"http": proxy, "https": proxy})
+    return session
+
+def _get_default_session() -> requests.Session:
+    """
+    Return the process-wide session shared by every scraper without a proxy,
+    so later scrapers start with warm connections.
+    """
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = _build_session()
+        return _DEFAULT_SESSION
+
+def build_async_client(
+    timeout: float = 10,
+    proxy: Optional[str] = None,
+    max_connections: int = 4,
+    keepalive_expiry: float = 300,
+) -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP/2 client used by :class:`AsyncBingSearchScraper`.
+    Idle connections are kept for ``keepalive_expiry`` seconds, so a run
+    resolves Bing's host name and completes the TLS handshake once instead
+    of per page. Pass one client to several scrapers to share its pool.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        proxy=proxy,
+        headers={"Accept": _ACCEPT, "Accept-Encoding": _ACCEPT_ENCODING},
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        follow_redirects=True,
+    )
+
+@dataclass(frozen=True)
+class _RequestContext:
+    # Per-request headers (sessions and clients may be shared between
+    # scrapers), the same merged with each rotated User-Agent, and the search
+    # URL with {term} and {first} left to fill in.
+    headers: Dict[str, str]
+    ua_headers: Tuple[Dict[str, str], ...]
+    url_template: str
+
+@lru_cache(maxsize=16)
+def _request_context(
+    base_url: str, market_code: str, language_code: str, results_per_page: int
+) -> _RequestContext:
+    """
+    Build the headers and URL template for one market/language/page-size
+    combination. A run only sees a handful of these, so every page after the
+    first reuses a cached context instead of rebuilding it.
+    """
+    headers = {"Accept-Language": language_code}
+    params = urlencode(
+        {"mkt": market_code, "setLang": language_code, "count": results_per_page}
+    )
+    return _RequestContext(
+        headers=headers,
+        ua_headers=tuple({**ua, **headers} for ua in _UA_HEADERS),
+        url_template=f"{base_url}?q={{term}}&{params}&first={{first}}",
+    )
+
+@dataclass
+class SearchQueryMeta:
+    term: str
+    resultsPerPage: int
+    page: int
+    url: str
+    marketCode: str
+    languageCode: str
+
+def parse_serp(
+    html: str,
+    meta: SearchQueryMeta,
+    include_html: bool = False,
+    html_snapshot_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Parse one SERP into the page-level object described in the README.
+
+    This is a plain module-level function so it can be shipped to worker
+    processes.
+    """
+    try:
+        root = lxml.html.document_fromstring(html, parser=_html_parser())
+    except (etree.ParserError, ValueError) as exc:
+        logger.debug("Failed to parse SERP HTML for %s: %s", meta.url, exc)
+        root = lxml.html.document_fromstring("<html></html>")
+
+    results_total = _extract_results_total(root)
+    organic_results = _extract_organic_results(root)
+    paid_results = _extract_paid_results(root)
+    people_also_ask = _extract_people_also_ask(root)
+    related_queries = _extract_related_queries(root)
+
+    result: Dict[str, Any] = {
+        "searchQuery": {
+            "term": meta.term,
+            "resultsPerPage": meta.resultsPerPage,
+            "page": meta.page,
+            "url": meta.url,
+            "marketCode": meta.marketCode,
+            "languageCode": meta.languageCode,
+        },
+        "htmlSnapshotUrl": None,
+        "resultsTotal": results_total,
+        "organicResults": organic_results,
+        "paidResults": paid_results,
+        "peopleAlsoAsk": people_also_ask,
+        "relatedQueries": related_queries,
+    }
+    # Raw HTML is only carried around when asked for; a snapshot
+    # directory keeps it on disk so only its path stays in memory.
+    if include_html:
+        result["html"] = html
+    if html_snapshot_dir is not None:
+        result["htmlSnapshotPath"] = _write_html_snapshot(
+            html, meta, Path(html_snapshot_dir)
+        )
+    return result
+
+def _write_html_snapshot(
+    html: str, meta: SearchQueryMeta, snapshot_dir: Path
+) -> str:
+    digest = hashlib.sha256(meta.url.encode("utf-8")).hexdigest()[:16]
+    path = snapshot_dir / f"{digest}-p{meta.page}.html.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(html)
+    return str(path)
+
+def _extract_results_total(root: etree._Element) -> Optional[int]:
+    """
+    Extract the approximate number of results, e.g. "1,234 results".
+    """
+    try:
+        count_el = _first(root, _SEL_RESULTS_COUNT)
+        text = _text(count_el, " ")
+        if not text:
+            return None
+        # Usually something like "About 1,234 results", or on later pages
+        # "11-20 of 1,234 results"; the total is always the last number.
+        numbers = _NUMBER_RE.findall(text)
+        if not numbers:
+            return None
+        return int(_NON_DIGIT_RE.sub("", numbers[-1]))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.debug("Failed to parse results total: %s", exc)
+        return None
+
+def _extract_organic_results(root: etree._Element) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+
+    # Organic results are typically li.b_algo in the #b_results list
+    organic_listings = _SEL_ORGANIC(root)
+    position = 0
+
+    for li in organic_listings:
+        # Collect every field in one walk over the listing rather than a
+        # separate subtree search per field.
+        title_el = desc_el = display_url_el = icon_el = None
+        strongs: List[etree._Element] = []
+        for node in li.iter():
+            tag = node.tag
+            if tag == "strong":
+                strongs.append(node)
+            elif tag == "h2":
+                if title_el is None:
+                    title_el = node
+            elif tag == "p":
+                if desc_el is None:
+                    desc_el = node
+            elif tag == "div":
+                if display_url_el is None and "b_attribution" in _classes(node):
+                    display_url_el = node.find(".//cite")
+            elif tag == "img":
+                if icon_el is None and not _ICON_CLASSES.isdisjoint(_classes(node)):
+                    icon_el = node
+
+        link = title_el.find(".//a") if title_el is not None else None
+        if link is None or not link.get("href"):
+            continue
+
+        position += 1
+        url = link.get("href")
+        title = _text(link)
+
+        description = _text(desc_el, " ")
+
+        displayed_url = _text(display_url_el) if display_url_el is not None else url
+
+        icon_url = icon_el.get("src") if icon_el is not None and icon_el.get("src") else None
+
+        emphasized_keywords: List[str] = []
+        seen_keywords = set()
+        for strong in strongs:
+            kw = _text(strong)
+            if not kw:
+                continue
+            key = kw.lower()
+            if key in seen_keywords:
+                continue
+            seen_keywords.add(key)
+            emphasized_keywords.append(kw)
+
+        items.append(
+            {
+                "iconUrl": icon_url,
+                "displayedUrl": displayed_url,
+                "title": title,
+                "url": url,
+                "description": description,
+                "emphasizedKeywords": emphasized_keywords,
+                "type": "organic",
+                "position": position,
+            }
+        )
+
+    return items
+
+def _extract_paid_results(root: etree._Element) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+
+    # Paid ads often live in containers with class "b_ad" or "b_adresult"
+    paid_blocks = _SEL_PAID(root)
+    position = 0
+
+    for li in paid_blocks:
+        title_el = li.find(".//h2")
+        link = title_el.find(".//a") if title_el is not None else None
+        if link is None or not link.get("href"):
+            continue
+
+        position += 1
+        url = link.get("href")
+        title = _text(link)
+
+        desc_el = li.find(".//p")
+        description = _text(desc_el, " ")
+
+        display_url_el = _first(li, _SEL_PAID_CITE)
+        displayed_url = _text(display_url_el) if display_url_el is not None else url
+
+        items.append(
+            {
+                "title": title,
+                "url": url,
+                "displayedUrl": displayed_url,
+                "description": description,
+                "type": "ad",
+                "position": position,
+            }
+        )
+
+    return items
+
+def _extract_people_also_ask(root: etree._Element) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+
+    # People Also Ask ("PAA") often lives in b_expando or related containers
+    paa_blocks = _SEL_PAA(root)
+    for block in paa_blocks:
+        # One query returns the question, answer and link candidates in
+        # document order; keep the first of each.
+        q_el = a_el = link = None
+        for node in _SEL_PAA_PARTS(block):
+            if node.tag == "a":
+                if link is None:
+                    link = node
+                continue
+            classes = _classes(node)
+            if q_el is None and "b_q" in classes:
+                q_el = node
+            elif a_el is None and "b_a" in classes:
+                a_el = node
+
+        question_text = _text(q_el, " ")
+        answer_text = _text(a_el, " ")
+        url = link.get("href") if link is not None else None
+
+        if question_text:
+            items.append(
+                {
+                    "url": url,
+                    "question": question_text,
+                    "answer": answer_text or None,
+                }
+            )
+
+    return items
+
+def _extract_related_queries(root: etree._Element) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+
+    # Related searches are the list items of the .b_rs block.
+    for li in _SEL_REL_LIS(root):
+        link = _first(li, _SEL_LINK)
+        if link is None:
+            continue
+        title = _text(link, " ")
+        url = link.get("href")
+        if title:
+            items.append({"title": title, "url": url})
+
+    return items
+
+class _BingScraperBase:
+    """
+    Shared configuration, URL building and SERP parsing for the sync and async
+    scrapers. Subclasses only add the transport used to fetch pages.
+    """
+
+    BASE_URL = "https://www.bing.com/search"
+
+    def __init__(
+        self,
+        market_code: str = "en-US",
+        language_code: str = "en",
+        results_per_page: int = 10,
+        include_html: bool = False,
+        softblock_handler: Optional[SoftBlockHandler] = None,
+        request_timeout: int = 10,
+        proxy: Optional[str] = None,
+        html_snapshot_dir: Optional[Path] = None,
+        page_cache: Optional[PageCache] = None,
+    ) -> None:
+        self.market_code = market_code
+        self.language_code = language_code
+        self.results_per_page = results_per_page
+        self.include_html = include_html
+        self.softblock_handler = softblock_handler or SoftBlockHandler()
+        self.request_timeout = request_timeout
+        self.proxy = proxy
+        self.html_snapshot_dir = Path(html_snapshot_dir) if html_snapshot_dir else None
+        if self.html_snapshot_dir is not None:
+            self.html_snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self.page_cache = page_cache
+
+    # --------------------------------------------------------------------- #
+    # Internal helpers
+    # --------------------------------------------------------------------- #
+
+    def _build_metas(
+        self,
+        term: str,
+        pages: int,
+        results_per_page: Optional[int],
+        market_code: Optional[str],
+        language_code: Optional[str],
+    ) -> Tuple[_RequestContext, List[SearchQueryMeta]]:
+        rp = results_per_page or self.results_per_page
+        mkt = market_code or self.market_code
+        lang = language_code or self.language_code
+        context = _request_context(self.BASE_URL, mkt, lang, rp)
+        quoted_term = quote_plus(term)
+
+        return context, [
+            SearchQueryMeta(
+                term=term,
+                resultsPerPage=rp,
+                page=page,
+                url=context.url_template.format(
+                    term=quoted_term, first=(page - 1) * rp + 1
+                ),
+                marketCode=mkt,
+                languageCode=lang,
+            )
+            for page in range(1, pages + 1)
+        ]
+
+    def _store_page(self, url: str, html: str, status: Optional[int]) -> None:
+        # Only 2xx pages are cached; error pages are not. A block page served
+        # with 200 would otherwise persist across runs, so the body is also
+        # scanned for block hints before it is written.
+        if (
+            self.page_cache is not None
+            and status is not None
+            and 200 <= status < 300
+            and not self.softblock_handler.is_soft_blocked(html)
+        ):
+            self.page_cache.set(url, html)
+
+    def _parse_page(self, html: str, meta: SearchQueryMeta) -> Dict[str, Any]:
+        return parse_serp(html, meta, self.include_html, self.html_snapshot_dir)
+
+    def _parse_pages(
+        self, htmls: List[str], metas: List[SearchQueryMeta]
+    ) -> List[Dict[str, Any]]:
+        return [self._parse_page(html, meta) for html, meta in zip(htmls, metas)]
+
+class BingSearchScraper(_BingScraperBase):
+    """
+    A lightweight Bing search scraper focused on extracting structured SERP data.
+
+    It does not try to be bulletproof against every layout change, but it uses
+    stable selectors observed on Bing search result pages.
+    """
+
+    def __init__(
+        self,
+        market_code: str = "en-US",
+        language_code: str = "en",
+        results_per_page: int = 10,
+        include_html: bool = False,
+        softblock_handler: Optional[SoftBlockHandler] = None,
+        request_timeout: int = 10,
+        proxy: Optional[str] = None,
+        html_snapshot_dir: Optional[Path] = None,
+        page_cache: Optional[PageCache] = None,
+        session: Optional[requests.Session] = None,
+        parse_workers: int = 0,
+    ) -> None:
+        super().__init__(
+            market_code=market_code,
+            language_code=language_code,
+            results_per_page=results_per_page,
+            include_html=include_html,
+            softblock_handler=softblock_handler,
+            request_timeout=request_timeout,
+            proxy=proxy,
+            html_snapshot_dir=html_snapshot_dir,
+            page_cache=page_cache,
+        )
+
+        # Scrapers share the module-level session unless they need their own
+        # proxy settings or the caller supplies a session.
+        if session is not None:
+            self.session = session
+        elif self.proxy:
+            self.session = _build_session(self.proxy)
+        else:
+            self.session = _get_default_session()
+        # With more than one worker, pages are parsed in a process pool.
+        self.parse_workers = parse_workers
+
+    @staticmethod
+    def close_default_session() -> None:
+        """
+        Close the shared default session; the next scraper that needs it gets
+        a fresh one. Mostly useful in tests.
+        """
+        global _DEFAULT_SESSION
+        with _DEFAULT_SESSION_LOCK:
+            if _DEFAULT_SESSION is not None:
+                _DEFAULT_SESSION.close()
+                _DEFAULT_SESSION = None
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def search(
+        self,
+        term: str,
+        pages: int = 1,
+        results_per_page: Optional[int] = None,
+        market_code: Optional[str] = None,
+        language_code: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform a Bing search and return structured data for each requested page.
+
+        Returns a list of page-level SERP objects as described in the README.
+        """
+        context, metas = self._build_metas(
+            term, pages, results_per_page, market_code, language_code
+        )
+
+        if not metas:
+            return []
+
+        htmls = self._fetch_batch([m.url for m in metas], context)
+        return self._parse_batch(htmls, metas)
+
+    def _parse_batch(
+        self, htmls: List[str], metas: List[SearchQueryMeta]
+    ) -> List[Dict[str, Any]]:
+        if self.parse_workers <= 1 or len(metas) <= 1:
+            return self._parse_pages(htmls, metas)
+
+        # Parsing is CPU-bound, so large batches are spread over processes.
+        with ProcessPoolExecutor(
+            max_workers=min(len(metas), self.parse_workers)
+        ) as executor:
+            return list(
+                executor.map(
+                    parse_serp,
+                    htmls,
+                    metas,
+                    repeat(self.include_html),
+                    repeat(self.html_snapshot_dir),
+                )
+            )
+
+    # --------------------------------------------------------------------- #
+    # Transport
+    # --------------------------------------------------------------------- #
+
+    def _fetch_batch(self, urls: List[str], context: _RequestContext) -> List[str]:
+        # Pages are independent URLs, so fetch them on a small thread pool;
+        # the pooled session is safe to share between the workers.
+        with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as executor:
+            return list(executor.map(self._fetch_page, urls, repeat(context)))
+
+    def _fetch_page(self, url: str, context: _RequestContext) -> str:
+        if self.page_cache is not None:
+            cached = self.page_cache.get(url)
+            if cached is not None:
+                return cached
+
+        # Be respectful: jitter each worker's start so concurrent page fetches
+        # do not reach Bing as one obvious burst.
+        time.sleep(random.uniform(0, 1.6))
+        return self._request_page(url, context)
+
+    def _request_page(self, url: str, context: _RequestContext) -> str:
+        # The session is shared process-wide, so rotate the User-Agent per
+        # request rather than relying on the one set on the session.
+        headers = context.ua_headers[random.randrange(len(context.ua_headers))]
+
+        logger.debug("Requesting Bing SERP: %s", url)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with self.session.get(
+                    url,
+                    headers=headers,
+                    timeout=self.request_timeout,
+                    stream=True,
+                ) as resp:
+                    # Only error statuses and challenge redirects are checked
+                    # for soft blocks; the banner sits at the top of the page,
+                    # so scan a prefix before reading the whole body.
+                    chunks = resp.iter_content(
+                        chunk_size=self.softblock_handler.SCAN_LIMIT
+                    )
+                    encoding = resp.encoding or "utf-8"
+                    head_bytes = next(chunks, b"")
+                    blocked = self.softblock_handler.is_suspect_response(
+                        resp.status_code, resp.url, resp.headers.get("Location", "")
+                    ) and self.softblock_handler.is_soft_blocked(head_bytes)
+                    if not blocked:
+                        html = (head_bytes + b"".join(chunks)).decode(
+                            encoding, errors="replace"
+                        )
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                logger.warning(
+                    "Network error on attempt %d fetching %s: %s",
+                    attempt,
+                    url,
+                    exc,
+                )
+                if attempt >= self.softblock_handler.max_retries:
+                    raise
+                time.sleep(self.softblock_handler.compute_backoff(attempt))
+                continue
+
+            if blocked:
+                logger.warning("Potential soft-block detected for url: %s", url)
+                html, status = self.softblock_handler.handle_soft_block(
+                    session=self.session,
+                    url=url,
+                    original_html=head_bytes.decode(encoding, errors="replace"),
+                    headers=context.headers,
+                    original_status=resp.status_code,
+                )
+                self._store_page(url, html, status)
+                return html
+
+            if not resp.ok:
+                logger.warning(
+                    "Unexpected HTTP status %s for url %s",
+                    resp.status_code,
+                    url,
+                )
+            else:
+                self._store_page(url, html, resp.status_code)
+
+            return html
+
+class AsyncBingSearchScraper(_BingScraperBase):
+    """
+    Asyncio flavour of :class:`BingSearchScraper`.
+
+    All pages (and any concurrent ``search`` calls made on the same instance)
+    share one ``httpx.AsyncClient``, so requests are multiplexed over a single
+    HTTP/2 connection. Create one instance and reuse it; building a client per
+    call throws the connection pool away. ``concurrency`` bounds how many
+    requests are in flight at once.
+
+    A ``client`` from :func:`build_async_client` may be passed in to share
+    one pool between scrapers; the caller then owns it and must close it.
+    """
+
+    def __init__(
+        self,
+        market_code: str = "en-US",
+        language_code: str = "en",
+        results_per_page: int = 10,
+        include_html: bool = False,
+        softblock_handler: Optional[SoftBlockHandler] = None,
+        request_timeout: int = 10,
+        proxy: Optional[str] = None,
+        html_snapshot_dir: Optional[Path] = None,
+        page_cache: Optional[PageCache] = None,
+        concurrency: int = 4,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(
+            market_code=market_code,
+            language_code=language_code,
+            results_per_page=results_per_page,
+            include_html=include_html,
+            softblock_handler=softblock_handler,
+            request_timeout=request_timeout,
+            proxy=proxy,
+            html_snapshot_dir=html_snapshot_dir,
+            page_cache=page_cache,
+        )
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._owns_client = client is None
+        if client is None:
+            client = build_async_client(
+                timeout=self.request_timeout,
+                proxy=self.proxy,
+                max_connections=concurrency,
+            )
+        self._client = client
+
+    async def __aenter__(self) -> "AsyncBingSearchScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    async def search(
+        self,
+        term: str,
+        pages: int = 1,
+        results_per_page: Optional[int] = None,
+        market_code: Optional[str] = None,
+        language_code: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all requested pages concurrently and return them in page order.
+        """
+        context, metas = self._build_metas(
+            term, pages, results_per_page, market_code, language_code
+        )
+        htmls = await asyncio.gather(
+            *(self._fetch_page(m.url, context) for m in metas)
+        )
+        # Parsing and any HTML snapshot writes run on a worker thread, so the
+        # loop keeps driving other requests meanwhile.
+        return await asyncio.to_thread(self._parse_pages, htmls, metas)
+
+    # --------------------------------------------------------------------- #
+    # Transport
+    # --------------------------------------------------------------------- #
+
+    async def _fetch_page(self, url: str, context: _RequestContext) -> str:
+        if self.page_cache is not None:
+            cached = await asyncio.to_thread(self.page_cache.get, url)
+            if cached is not None:
+                return cached
+
+        async with self._semaphore:
+            html = await self._request_page(url, context)
+            # Be respectful: keep each slot busy for a moment before the next
+            # request is allowed through.
+            await asyncio.sleep(random.uniform(0.8, 1.6))
+            return html
+
+    async def _request_page(self, url: str, context: _RequestContext) -> str:
+        headers = context.ua_headers[random.randrange(len(context.ua_headers))]
+
+        logger.debug("Requesting Bing SERP: %s", url)
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            try:
+                async with self._client.stream("GET", url, headers=headers) as resp:
+                    # Same checks as the sync scraper: suspect responses get
+                    # their first chunk scanned before the rest is read.
+                    chunks = resp.aiter_bytes(self.softblock_handler.SCAN_LIMIT)
+                    head_bytes = b""
+                    async for head_bytes in chunks:
+                        break
+                    blocked = self.softblock_handler.is_suspect_response(
+                        resp.status_code,
+                        str(resp.url),
+                        resp.headers.get("Location", ""),
+                    ) and self.softblock_handler.is_soft_blocked(head_bytes)
+                    if not blocked:
+                        rest = [chunk async for chunk in chunks]
+                        html = b"".join([head_bytes, *rest]).decode(
+                            resp.encoding, errors="replace"
+                        )
+            except httpx.TransportError as exc:
+                logger.warning(
+                    "Network error on attempt %d fetching %s: %s",
+                    attempt,
+                    url,
+                    exc,
+                )
+                if attempt >= self.softblock_handler.max_retries:
+                    raise
+                delay = await self.softblock_handler.wait(attempt, delay)
+                continue
+
+            if blocked:
+                logger.warning("Potential soft-block detected for url: %s", url)
+                html, status = await self.softblock_handler.handle_soft_block_async(
+                    client=self._client,
+                    url=url,
+                    original_html=head_bytes.decode(resp.encoding, errors="replace"),
+                    headers=context.headers,
+                    original_status=resp.status_code,
+                )
+                await asyncio.to_thread(self._store_page, url, html, status)
+                return html
+
+            if resp.is_error:
+                logger.warning(
+                    "Unexpected HTTP status %s for url %s",
+                    resp.status_code,
+                    url,
+                )
+            else:
+                await asyncio.to_thread(
+                    self._store_page, url, html, resp.status_code
+                )
+
+            return html
@@ -0,0 +1,88 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class PageCache:
+    """
+    Disk cache of fetched SERP HTML, keyed by the search URL.
+
+    The URL already encodes term, page, market and language, so re-running
+    unchanged queries reads the page from disk instead of hitting Bing.
+    Entries older than ``ttl_seconds`` are ignored and refetched; with
+    ``force_update`` every page is refetched and the cache is refreshed.
+    Expired entries are deleted, and at most ``max_entries`` pages are kept,
+    so the directory does not grow without bound.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl_seconds: float = 3600,
+        force_update: bool = False,
+        max_entries: int = 10_000,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.force_update = force_update
+        self.max_entries = max_entries
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prune()
+
+    def prune(self) -> None:
+        """
+        Delete expired entries (and temporary files left behind by an
+        interrupted write), then the oldest entries beyond ``max_entries``.
+        """
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if now - mtime > self.ttl_seconds:
+                    Path(entry.path).unlink(missing_ok=True)
+                elif entry.name.endswith(".html"):
+                    entries.append((mtime, entry.path))
+
+        if len(entries) > self.max_entries:
+            entries.sort(reverse=True)
+            for _, path in entries[self.max_entries :]:
+                Path(path).unlink(missing_ok=True)
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.html"
+
+    def get(self, url: str) -> Optional[str]:
+        if self.force_update:
+            return None
+
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            html = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        logger.debug("Serving cached SERP for %s", url)
+        return html
+
+    def set(self, url: str, html: str) -> None:
+        path = self._path(url)
+        # Write to a temporary file first so concurrent readers never see a
+        # half-written page.
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(html, encoding="utf-8")
+        os.replace(tmp_path, path)
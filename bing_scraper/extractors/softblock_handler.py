@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import ahocorasick
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+class SoftBlockHandler:
+    """
+    Detects and mitigates "soft blocks" from Bing, such as temporary
+    throttling, generic error pages, or CAPTCHA / robot checks.
+
+    This is heuristic-based – it looks for typical phrases and patterns,
+    and retries the request with backoff and a rotated User-Agent.
+    """
+
+    SOFT_BLOCK_HINTS = [
+        "unusual traffic",
+        "verify that you are a human",
+        "detected unusual activity",
+        "please try again later",
+        "are you a robot",
+        "unusual behavior from your computer",
+    ]
+
+    # Soft blocks arrive as error statuses or redirects to a challenge page.
+    SOFT_BLOCK_URL_HINTS = ("captcha", "challenge")
+
+    # Block banners show up in the first screenful of the page. The fetchers
+    # read exactly this much of a response as its first chunk, which is all
+    # is_soft_blocked() looks at.
+    SCAN_LIMIT = 32 * 1024
+
+    # Upper bound for a single async backoff wait, in seconds.
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 1.5) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # Match every hint in a single pass over the page.
+        self._automaton = ahocorasick.Automaton()
+        for hint in self.SOFT_BLOCK_HINTS:
+            self._automaton.add_word(hint, hint)
+        self._automaton.make_automaton()
+
+    # Public API ----------------------------------------------------------- #
+
+    def is_suspect_response(
+        self, status_code: int, url: str, location: str = ""
+    ) -> bool:
+        """
+        Cheap status/URL check deciding whether a response body is worth
+        scanning at all; a normal 2xx SERP skips the scan entirely.
+
+        Only the host and path of the URL and of ``location`` are checked:
+        the query string carries the search term, and a search for
+        "captcha" must not make every page of it suspect.
+        """
+        if status_code >= 400:
+            return True
+        for target in (url, location):
+            parts = urlsplit(target)
+            target = f"{parts.netloc}{parts.path}".lower()
+            if any(hint in target for hint in self.SOFT_BLOCK_URL_HINTS):
+                return True
+        return False
+
+    def is_soft_blocked(self, html: Union[str, bytes]) -> bool:
+        prefix = html[: self.SCAN_LIMIT].lower()
+        if isinstance(prefix, bytes):
+            # The hints are ASCII, so latin-1 maps the bytes 1:1 and never fails.
+            prefix = prefix.decode("latin-1")
+        return next(self._automaton.iter(prefix), None) is not None
+
+    def compute_backoff(self, attempt: int) -> float:
+        # Simple exponential backoff with jitter.
+        base = (self.backoff_factor ** (attempt - 1)) if attempt > 0 else 1.0
+        jitter = random.uniform(0, 0.5)
+        return base + jitter
+
+    def decorrelated_backoff(self, attempt: int, previous: float = 0.0) -> float:
+        # Decorrelated jitter: each delay is drawn between the exponential
+        # base and three times the previous delay, so pages that were blocked
+        # together by one gather() do not all retry at the same moment.
+        base = (self.backoff_factor ** (attempt - 1)) if attempt > 0 else 1.0
+        upper = max(base, previous) * 3
+        return min(self.MAX_BACKOFF, random.uniform(base, upper))
+
+    async def wait(self, attempt: int, previous: float = 0.0) -> float:
+        """
+        Back off before retry ``attempt`` without blocking the event loop, so
+        other in-flight pages keep making progress. Returns the delay used,
+        to be passed back as ``previous`` on the next attempt.
+        """
+        delay = self.decorrelated_backoff(attempt, previous)
+        logger.debug("Backing off %.2fs before attempt %d", delay, attempt)
+        await asyncio.sleep(delay)
+        return delay
+
+    def _retry_headers(
+        self, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        # Rotate headers slightly to look less like a bot.
+        return {
+            **(headers or {}),
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                f"AppleWebKit/537.36 (KHTML, like Gecko) "
+                f"Chrome/{random.randint(110, 125)}.0 Safari/537.36"
+            ),
+            "Cache-Control": "no-cache",
+        }
+
+    def handle_soft_block(
+        self,
+        session: requests.Session,
+        url: str,
+        original_html: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        original_status: Optional[int] = None,
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Attempt to recover from a soft-blocked page by retrying the request
+        with backoff and minor header variations. ``headers`` are sent along
+        with every retry, e.g. per-scraper headers on a shared session.
+
+        Returns the HTML of the recovered page together with its HTTP status
+        (``original_status`` if the original page turns out not to be
+        blocked), or raises RuntimeError if not recovered. The status lets
+        callers tell a real SERP from an error page without a block banner.
+        """
+        if original_html is not None and not self.is_soft_blocked(original_html):
+            return original_html, original_status
+
+        attempt = 0
+        last_html = original_html or ""
+
+        while attempt < self.max_retries:
+            attempt += 1
+            delay = self.compute_backoff(attempt)
+            logger.warning(
+                "Soft block detected. Retrying attempt %d/%d after %.2fs",
+                attempt,
+                self.max_retries,
+                delay,
+            )
+            time.sleep(delay)
+
+            try:
+                resp = session.get(
+                    url, headers=self._retry_headers(headers), timeout=15
+                )
+                last_html = resp.text
+                last_status = resp.status_code
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                logger.warning(
+                    "Network error while resolving soft block on attempt %d: %s",
+                    attempt,
+                    exc,
+                )
+                continue
+
+            if not self.is_soft_blocked(last_html):
+                logger.info("Soft block resolved successfully on attempt %d.", attempt)
+                return last_html, last_status
+
+        logger.error(
+            "Failed to resolve soft block after %d retries for URL: %s",
+            self.max_retries,
+            url,
+        )
+        raise RuntimeError("Soft block could not be resolved after retries.")
+
+    async def handle_soft_block_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        original_html: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        original_status: Optional[int] = None,
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Async counterpart of :meth:`handle_soft_block`; backoff waits yield to
+        the event loop instead of blocking it.
+        """
+        if original_html is not None and not self.is_soft_blocked(original_html):
+            return original_html, original_status
+
+        attempt = 0
+        delay = 0.0
+        last_html = original_html or ""
+
+        while attempt < self.max_retries:
+            attempt += 1
+            logger.warning(
+                "Soft block detected. Retrying attempt %d/%d",
+                attempt,
+                self.max_retries,
+            )
+            delay = await self.wait(attempt, delay)
+
+            try:
+                resp = await client.get(
+                    url, headers=self._retry_headers(headers), timeout=15
+                )
+                last_html = resp.text
+                last_status = resp.status_code
+            except httpx.TransportError as exc:
+                logger.warning(
+                    "Network error while resolving soft block on attempt %d: %s",
+                    attempt,
+                    exc,
+                )
+                continue
+
+            if not self.is_soft_blocked(last_html):
+                logger.info("Soft block resolved successfully on attempt %d.", attempt)
+                return last_html, last_status
+
+        logger.error(
+            "Failed to resolve soft block after %d retries for URL: %s",
+            self.max_retries,
+            url,
+        )
+        raise RuntimeError("Soft block could not be resolved after retries.")
\ No newline at end of file
@@ -0,0 +1,26 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+async def read_bytes(path: Path) -> bytes:
+    """
+    Read a file on a worker thread. asyncio has no native file I/O, so this
+    keeps the event loop free to drive in-flight requests meanwhile.
+    """
+    return await asyncio.to_thread(path.read_bytes)
+
+def _write_pages(
+    write: Callable[[Dict[str, Any]], None], pages: List[Dict[str, Any]]
+) -> None:
+    for page_obj in pages:
+        write(page_obj)
+
+async def write_pages(
+    write: Callable[[Dict[str, Any]], None], pages: List[Dict[str, Any]]
+) -> None:
+    """
+    Pass every page to ``write`` (e.g. :meth:`Exporter.write`) in a single
+    worker-thread hop, so one query's writes to every output format run
+    together without blocking the event loop.
+    """
+    await asyncio.to_thread(_write_pages, write, pages)
@@ -0,0 +1,454 @@
+import logging
+import os
+import re
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+# pandas (and openpyxl through it) and lxml are imported inside the writers
+# that use them, so e.g. a JSON-only run never pays for loading them.
+
+logger = logging.getLogger(__name__)
+
+FLAT_COLUMNS = (
+    "searchTerm",
+    "page",
+    "marketCode",
+    "languageCode",
+    "resultType",
+    "position",
+    "title",
+    "url",
+    "displayedUrl",
+    "description",
+    "iconUrl",
+    "emphasizedKeywords",
+)
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+KNOWN_FORMATS = frozenset({"json", "ndjson", "csv", "excel", "xlsx", "xml"})
+
+# Control characters XML 1.0 cannot represent; lxml refuses to write them.
+_XML_INVALID_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+def _extend_columns(
+    columns: Dict[str, List[Any]],
+    size: int,
+    meta: Dict[str, Any],
+    result_type: str,
+    fields: Dict[str, List[Any]],
+) -> None:
+    """
+    Append ``size`` rows to ``columns``: the search metadata and result type
+    are repeated for every row, ``fields`` supplies per-row values and any
+    column not present in ``fields`` is filled with None.
+    """
+    if not size:
+        return
+    constants = {
+        "searchTerm": meta.get("term"),
+        "page": meta.get("page"),
+        "marketCode": meta.get("marketCode"),
+        "languageCode": meta.get("languageCode"),
+        "resultType": result_type,
+    }
+    for name in FLAT_COLUMNS:
+        if name in fields:
+            columns[name].extend(fields[name])
+        else:
+            columns[name].extend([constants.get(name)] * size)
+
+def _flatten_results(results: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Flatten page-level results into row-level columns suitable for CSV/Excel.
+    Each row corresponds to an individual result (organic, paid, PAA, related);
+    the return value maps every name in FLAT_COLUMNS to one list of values.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in FLAT_COLUMNS}
+
+    for page_obj in results:
+        meta = page_obj.get("searchQuery", {})
+
+        # Organic
+        organic = page_obj.get("organicResults", [])
+        _extend_columns(
+            columns,
+            len(organic),
+            meta,
+            "organic",
+            {
+                "position": [item.get("position") for item in organic],
+                "title": [item.get("title") for item in organic],
+                "url": [item.get("url") for item in organic],
+                "displayedUrl": [item.get("displayedUrl") for item in organic],
+                "description": [item.get("description") for item in organic],
+                "iconUrl": [item.get("iconUrl") for item in organic],
+                "emphasizedKeywords": [
+                    ", ".join(item.get("emphasizedKeywords", []) or [])
+                    for item in organic
+                ],
+            },
+        )
+
+        # Paid ads
+        paid = page_obj.get("paidResults", [])
+        _extend_columns(
+            columns,
+            len(paid),
+            meta,
+            "ad",
+            {
+                "position": [item.get("position") for item in paid],
+                "title": [item.get("title") for item in paid],
+                "url": [item.get("url") for item in paid],
+                "displayedUrl": [item.get("displayedUrl") for item in paid],
+                "description": [item.get("description") for item in paid],
+            },
+        )
+
+        # People also ask
+        paa = page_obj.get("peopleAlsoAsk", [])
+        _extend_columns(
+            columns,
+            len(paa),
+            meta,
+            "people_also_ask",
+            {
+                "position": list(range(1, len(paa) + 1)),
+                "title": [item.get("question") for item in paa],
+                "url": [item.get("url") for item in paa],
+                "description": [item.get("answer") for item in paa],
+            },
+        )
+
+        # Related queries
+        related = page_obj.get("relatedQueries", [])
+        _extend_columns(
+            columns,
+            len(related),
+            meta,
+            "related_query",
+            {
+                "position": list(range(1, len(related) + 1)),
+                "title": [item.get("title") for item in related],
+                "url": [item.get("url") for item in related],
+            },
+        )
+
+    return columns
+
+def export_json(results: List[Dict[str, Any]], output_path: Path) -> None:
+    logger.info("Writing JSON output to %s", output_path)
+    # orjson always emits UTF-8 bytes, so the file is written in binary mode.
+    with output_path.open("wb") as f:
+        f.write(
+            orjson.dumps(results, option=_JSON_OPTIONS)
+        )
+
+def export_ndjson(results: List[Dict[str, Any]], output_path: Path) -> None:
+    """
+    Write one compact JSON object per page, so downstream tools can
+    stream-parse the file line by line.
+    """
+    logger.info("Writing NDJSON output to %s", output_path)
+    with output_path.open("wb") as f:
+        for page_obj in results:
+            f.write(orjson.dumps(page_obj, option=orjson.OPT_APPEND_NEWLINE))
+
+def export_csv(results: List[Dict[str, Any]], output_path: Path) -> None:
+    logger.info("Writing CSV output to %s", output_path)
+    columns = _flatten_results(results)
+    if not columns["searchTerm"]:
+        logger.warning("No rows to export to CSV.")
+        return
+    import pandas as pd
+
+    # CRLF rows, as csv.DictWriter wrote them before pandas.
+    pd.DataFrame(columns).to_csv(
+        output_path, index=False, encoding="utf-8", lineterminator="\r\n"
+    )
+
+def export_excel(results: List[Dict[str, Any]], output_path: Path) -> None:
+    logger.info("Writing Excel output to %s", output_path)
+    columns = _flatten_results(results)
+    if not columns["searchTerm"]:
+        logger.warning("No rows to export to Excel.")
+        return
+    import pandas as pd
+
+    pd.DataFrame(columns).to_excel(output_path, index=False)
+
+def _xml_text(value: Any) -> str:
+    return "" if value is None else _XML_INVALID_RE.sub("", str(value))
+
+def _write_xml_items(
+    xf: Any, tag_name: str, items: Iterable[Dict[str, Any]]
+) -> None:
+    with xf.element(tag_name):
+        for item in items:
+            with xf.element("item"):
+                for k, v in item.items():
+                    with xf.element(k):
+                        xf.write(_xml_text(v))
+
+def _write_xml_page(xf: Any, page_obj: Dict[str, Any]) -> None:
+    with xf.element("page"):
+        meta = page_obj.get("searchQuery", {})
+
+        for key in ["term", "resultsPerPage", "page", "url", "marketCode", "languageCode"]:
+            value = meta.get(key)
+            if value is not None:
+                with xf.element(key):
+                    xf.write(_xml_text(value))
+
+        for tag_name in [
+            "organicResults",
+            "paidResults",
+            "peopleAlsoAsk",
+            "relatedQueries",
+        ]:
+            _write_xml_items(xf, tag_name, page_obj.get(tag_name, []))
+
+def export_xml(results: List[Dict[str, Any]], output_path: Path) -> None:
+    logger.info("Writing XML output to %s", output_path)
+    from lxml import etree
+
+    # Elements are serialized as they are produced instead of building the
+    # whole document tree in memory first.
+    with etree.xmlfile(str(output_path), encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("searchResults"):
+            for page_obj in results:
+                _write_xml_page(xf, page_obj)
+
+def export_all(
+    results: List[Dict[str, Any]],
+    output_dir: Path,
+    formats: List[str],
+    base_filename: str = "results",
+) -> None:
+    """
+    Export results in all requested formats. Unknown formats are ignored with a warning.
+    """
+    format_set = {fmt.lower() for fmt in formats}
+
+    if "json" in format_set:
+        export_json(results, output_dir / f"{base_filename}.json")
+
+    if "ndjson" in format_set:
+        export_ndjson(results, output_dir / f"{base_filename}.ndjson")
+
+    if "csv" in format_set:
+        export_csv(results, output_dir / f"{base_filename}.csv")
+
+    if "excel" in format_set or "xlsx" in format_set:
+        export_excel(results, output_dir / f"{base_filename}.xlsx")
+
+    if "xml" in format_set:
+        export_xml(results, output_dir / f"{base_filename}.xml")
+
+    unknown = format_set - KNOWN_FORMATS
+    for fmt in unknown:
+        logger.warning("Unknown output format requested and ignored: %s", fmt)
+
+class Exporter:
+    """
+    Streaming counterpart of :func:`export_all`: page-level results are
+    written to every requested format as they arrive, so a run never has to
+    hold all of its pages in memory. Excel has no streaming writer, so only
+    its flattened rows are buffered until :meth:`close`.
+
+    Files are opened on the first page, so an empty run leaves none behind.
+    They are written under a ``.partial`` suffix and only renamed to their
+    final names when the exporter closes without an error; a failed run
+    leaves its output clearly marked as incomplete.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        formats: List[str],
+        base_filename: str = "results",
+    ) -> None:
+        format_set = {fmt.lower() for fmt in formats}
+        self.count = 0
+        self._closed = False
+
+        self._stack = ExitStack()
+        # (partial path, final path) of every file opened so far.
+        self._partials: List[Tuple[Path, Path]] = []
+        self._json: Optional[IO[bytes]] = None
+        self._json_path: Optional[Path] = None
+        self._ndjson: Optional[IO[bytes]] = None
+        self._ndjson_path: Optional[Path] = None
+        self._csv: Optional[IO[str]] = None
+        self._csv_path: Optional[Path] = None
+        self._excel_columns: Optional[Dict[str, List[Any]]] = None
+        self._excel_path: Optional[Path] = None
+        self._xml: Any = None
+        self._xml_path: Optional[Path] = None
+
+        if "json" in format_set:
+            self._json_path = output_dir / f"{base_filename}.json"
+            logger.info("Writing JSON output to %s", self._json_path)
+
+        if "ndjson" in format_set:
+            self._ndjson_path = output_dir / f"{base_filename}.ndjson"
+            logger.info("Writing NDJSON output to %s", self._ndjson_path)
+
+        if "csv" in format_set:
+            self._csv_path = output_dir / f"{base_filename}.csv"
+            logger.info("Writing CSV output to %s", self._csv_path)
+
+        if "excel" in format_set or "xlsx" in format_set:
+            self._excel_path = output_dir / f"{base_filename}.xlsx"
+            self._excel_columns = {name: [] for name in FLAT_COLUMNS}
+
+        if "xml" in format_set:
+            self._xml_path = output_dir / f"{base_filename}.xml"
+            logger.info("Writing XML output to %s", self._xml_path)
+
+        unknown = format_set - KNOWN_FORMATS
+        for fmt in unknown:
+            logger.warning("Unknown output format requested and ignored: %s", fmt)
+
+        # write(page_obj) appends one page-level result to every format.
+        self.write = self._compile_write()
+
+    def __enter__(self) -> "Exporter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self.close(failed=exc_type is not None)
+
+    def _partial_path(self, path: Path) -> Path:
+        partial = path.with_name(f"{path.name}.partial")
+        self._partials.append((partial, path))
+        return partial
+
+    def _open(self, path: Path, mode: str, **kwargs: Any) -> IO[Any]:
+        return self._stack.enter_context(
+            self._partial_path(path).open(mode, **kwargs)
+        )
+
+    def _write_json(self, page_obj: Dict[str, Any]) -> None:
+        # Indent each page one level so the file matches export_json.
+        if self._json is None:
+            self._json = self._open(self._json_path, "wb")
+            self._json.write(b"[\n  ")
+        else:
+            self._json.write(b",\n  ")
+        self._json.write(
+            orjson.dumps(page_obj, option=_JSON_OPTIONS).replace(b"\n", b"\n  ")
+        )
+
+    def _write_ndjson(self, page_obj: Dict[str, Any]) -> None:
+        if self._ndjson is None:
+            self._ndjson = self._open(self._ndjson_path, "wb")
+        self._ndjson.write(orjson.dumps(page_obj, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _write_csv(self, columns: Dict[str, List[Any]]) -> None:
+        if not columns["searchTerm"]:
+            return
+        import pandas as pd
+
+        write_header = self._csv is None
+        if self._csv is None:
+            self._csv = self._open(
+                self._csv_path, "w", encoding="utf-8", newline=""
+            )
+        pd.DataFrame(columns).to_csv(
+            self._csv, header=write_header, index=False, lineterminator="\r\n"
+        )
+
+    def _write_excel(self, columns: Dict[str, List[Any]]) -> None:
+        for name, values in columns.items():
+            self._excel_columns[name].extend(values)
+
+    def _write_xml(self, page_obj: Dict[str, Any]) -> None:
+        if self._xml is None:
+            from lxml import etree
+
+            self._xml = self._stack.enter_context(
+                etree.xmlfile(
+                    str(self._partial_path(self._xml_path)), encoding="utf-8"
+                )
+            )
+            self._xml.write_declaration()
+            self._stack.enter_context(self._xml.element("searchResults"))
+        _write_xml_page(self._xml, page_obj)
+
+    def _compile_write(self) -> Callable[[Dict[str, Any]], None]:
+        """
+        Generate the ``write`` function for this exporter's formats. The
+        format set is fixed for the whole run, so the generated function
+        calls only the writers that are in use, with no per-format checks.
+        """
+        namespace: Dict[str, Any] = {"exporter": self}
+        lines = ["def write(page_obj):"]
+        if self._json_path is not None:
+            namespace["write_json"] = self._write_json
+            lines.append("    write_json(page_obj)")
+        if self._ndjson_path is not None:
+            namespace["write_ndjson"] = self._write_ndjson
+            lines.append("    write_ndjson(page_obj)")
+        if self._csv_path is not None or self._excel_columns is not None:
+            # CSV and Excel share one flattening of the page.
+            namespace["flatten"] = _flatten_results
+            lines.append("    columns = flatten([page_obj])")
+            if self._csv_path is not None:
+                namespace["write_csv"] = self._write_csv
+                lines.append("    write_csv(columns)")
+            if self._excel_columns is not None:
+                namespace["write_excel"] = self._write_excel
+                lines.append("    write_excel(columns)")
+        if self._xml_path is not None:
+            namespace["write_xml"] = self._write_xml
+            lines.append("    write_xml(page_obj)")
+        lines.append("    exporter.count += 1")
+
+        exec("\n".join(lines), namespace)
+        return namespace["write"]
+
+    def close(self, failed: bool = False) -> None:
+        """
+        Finish every output file. With ``failed`` set, nothing is finalized:
+        JSON is left unterminated, Excel is not written and every file keeps
+        its ``.partial`` name.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._json is not None and not failed:
+            self._json.write(b"\n]")
+        self._stack.close()
+
+        if failed:
+            for partial, _ in self._partials:
+                logger.warning("Export did not finish; partial output in %s", partial)
+            return
+
+        for partial, path in self._partials:
+            os.replace(partial, path)
+
+        if not self.count:
+            return
+
+        if self._csv_path is not None and self._csv is None:
+            logger.warning("No rows to export to CSV.")
+
+        if self._excel_columns is not None:
+            logger.info("Writing Excel output to %s", self._excel_path)
+            if self._excel_columns["searchTerm"]:
+                import pandas as pd
+
+                pd.DataFrame(self._excel_columns).to_excel(
+                    self._excel_path, index=False
+                )
+            else:
+                logger.warning("No rows to export to Excel.")
+            self._excel_columns = None
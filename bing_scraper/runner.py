@@ -0,0 +1,434 @@
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple
+
+import orjson
+
+from bing_scraper.extractors.bing_parser import (
+    AsyncBingSearchScraper,
+    build_async_client,
+)
+from bing_scraper.extractors.page_cache import PageCache
+from bing_scraper.extractors.softblock_handler import SoftBlockHandler
+from bing_scraper.outputs.async_io import read_bytes, write_pages
+from bing_scraper.outputs.exporters import KNOWN_FORMATS, Exporter
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+logger = logging.getLogger("runner")
+
+def configure_logging(verbosity: int) -> None:
+    level = logging.WARNING
+    if verbosity == 1:
+        level = logging.INFO
+    elif verbosity >= 2:
+        level = logging.DEBUG
+
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+    )
+
+async def load_json_file(path: Path) -> Any:
+    # A missing file raises FileNotFoundError from the read itself, without
+    # a separate stat() beforehand.
+    return orjson.loads(await read_bytes(path))
+
+# Inputs and outputs are looked up relative to the working directory, so an
+# installed package behaves like a checkout run from the project root; the
+# example settings ship inside the package.
+DEFAULT_INPUTS = Path("data") / "inputs.sample.json"
+DEFAULT_SETTINGS = PACKAGE_DIR / "config" / "settings.example.json"
+DEFAULT_OUTPUT_DIR = Path("data")
+
+USAGE = (
+    "usage: runner.py [-h] [--inputs INPUTS] [--settings SETTINGS]\n"
+    "                 [--output-dir OUTPUT_DIR] [--formats FORMATS [FORMATS ...]]\n"
+    "                 [--include-html] [--no-cache] [--force-update] [-v]"
+)
+
+HELP = f"""{USAGE}
+
+Bing Search Scraper - extract structured SERP data from Bing.
+
+options:
+  -h, --help            show this help message and exit
+  --inputs INPUTS       Path to JSON file with input queries
+                        (default: {DEFAULT_INPUTS})
+  --settings SETTINGS   Path to JSON settings file
+                        (default: {DEFAULT_SETTINGS})
+  --output-dir OUTPUT_DIR
+                        Directory to store output files
+                        (default: {DEFAULT_OUTPUT_DIR})
+  --formats FORMATS [FORMATS ...]
+                        Output formats to generate (overrides settings).
+                        Allowed: json ndjson csv excel xml
+  --include-html        Include raw HTML of SERP pages in the output.
+  --no-cache            Always fetch SERP pages from Bing instead of the
+                        on-disk cache.
+  --force-update        Refetch every SERP page and refresh the on-disk cache.
+  -v, --verbose         Increase logging verbosity (-v, -vv)."""
+
+# Flags taking exactly one value, and on/off switches, by attribute name.
+_VALUE_FLAGS = {
+    "--inputs": "inputs",
+    "--settings": "settings",
+    "--output-dir": "output_dir",
+}
+_SWITCH_FLAGS = {
+    "--include-html": "include_html",
+    "--no-cache": "no_cache",
+    "--force-update": "force_update",
+}
+
+def _usage_error(message: str) -> NoReturn:
+    print(f"{USAGE}\nrunner.py: error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+_LONG_FLAGS = (
+    "--help",
+    *_VALUE_FLAGS,
+    "--formats",
+    *_SWITCH_FLAGS,
+    "--verbose",
+)
+
+def _expand_flag(flag: str) -> str:
+    # Long options may be abbreviated to any unambiguous prefix, as argparse
+    # allows (``--inp`` for ``--inputs``).
+    if not flag.startswith("--") or flag in _LONG_FLAGS:
+        return flag
+    matches = [name for name in _LONG_FLAGS if name.startswith(flag)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {flag} could match {', '.join(matches)}")
+    return matches[0] if matches else flag
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """
+    Parse the command line in a single pass over ``argv``. The flag set is
+    fixed, so a dispatch table replaces argparse and its start-up cost.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    args = SimpleNamespace(
+        inputs=str(DEFAULT_INPUTS),
+        settings=str(DEFAULT_SETTINGS),
+        output_dir=str(DEFAULT_OUTPUT_DIR),
+        formats=None,
+        include_html=False,
+        no_cache=False,
+        force_update=False,
+        verbose=0,
+    )
+
+    i = 0
+    while i < len(argv):
+        flag, has_value, value = argv[i].partition("=")
+        flag = _expand_flag(flag)
+        arg = f"{flag}={value}" if has_value else flag
+        i += 1
+
+        if arg in ("-h", "--help"):
+            print(HELP)
+            raise SystemExit(0)
+        elif flag in _VALUE_FLAGS:
+            if not has_value:
+                # Like argparse, a following option is not taken as the value.
+                if i == len(argv) or (argv[i].startswith("-") and argv[i] != "-"):
+                    _usage_error(f"argument {flag}: expected one argument")
+                value = argv[i]
+                i += 1
+            setattr(args, _VALUE_FLAGS[flag], value)
+        elif flag == "--formats":
+            formats = [value] if has_value else []
+            while i < len(argv) and not argv[i].startswith("-"):
+                formats.append(argv[i])
+                i += 1
+            if not formats:
+                _usage_error("argument --formats: expected at least one argument")
+            args.formats = formats
+        elif arg in _SWITCH_FLAGS:
+            setattr(args, _SWITCH_FLAGS[arg], True)
+        elif arg == "--verbose":
+            args.verbose += 1
+        elif len(arg) > 1 and arg.strip("v") == "-":
+            args.verbose += len(arg) - 1
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+
+    return args
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """The settings file, read once with every default filled in."""
+
+    market_code: str
+    language_code: str
+    results_per_page: int
+    pages: int
+    include_html: bool
+    html_snapshot_dir: Optional[str]
+    formats: List[str]
+    timeout: float
+    max_retries: int
+    backoff_factor: float
+    proxy: Optional[str]
+    concurrency: int
+    max_inflight_per_host: int
+    keepalive_expiry: float
+    cache_enabled: bool
+    cache_directory: str
+    cache_ttl_seconds: float
+    cache_max_entries: int
+
+def _to_settings(settings: Dict[str, Any]) -> Settings:
+    output_cfg = settings.get("output", {})
+    request_cfg = settings.get("request", {})
+    cache_cfg = settings.get("cache", {})
+    concurrency = int(request_cfg.get("concurrency", 4))
+    return Settings(
+        market_code=settings.get("marketCode", "en-US"),
+        language_code=settings.get("languageCode", "en"),
+        results_per_page=settings.get("resultsPerPage", 10),
+        pages=settings.get("pages", 1),
+        include_html=settings.get("includeHtml", False),
+        html_snapshot_dir=settings.get("htmlSnapshotDir"),
+        formats=output_cfg.get("formats", ["json"]),
+        timeout=request_cfg.get("timeout", 10),
+        max_retries=request_cfg.get("maxRetries", 3),
+        backoff_factor=request_cfg.get("backoffFactor", 1.5),
+        proxy=request_cfg.get("proxy"),
+        concurrency=concurrency,
+        max_inflight_per_host=int(
+            request_cfg.get("maxInflightPerHost", concurrency)
+        ),
+        keepalive_expiry=request_cfg.get("keepaliveExpiry", 300),
+        cache_enabled=cache_cfg.get("enabled", True),
+        cache_directory=cache_cfg.get("directory", ".cache"),
+        cache_ttl_seconds=cache_cfg.get("ttlSeconds", 3600),
+        cache_max_entries=cache_cfg.get("maxEntries", 10_000),
+    )
+
+def build_query_defaults(cfg: Settings) -> Dict[str, Any]:
+    """Global per-query defaults from settings, built once per run."""
+    return {
+        "resultsPerPage": cfg.results_per_page,
+        "pages": cfg.pages,
+        "marketCode": cfg.market_code,
+        "languageCode": cfg.language_code,
+    }
+
+def merge_query_with_settings(
+    query: Dict[str, Any], defaults: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge a single query definition with the prebuilt global defaults."""
+    return {**defaults, **query}
+
+def query_key(merged: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Everything that determines which SERP pages a merged query fetches."""
+    return (
+        merged["term"],
+        merged.get("marketCode"),
+        merged.get("languageCode"),
+        int(merged.get("resultsPerPage", 10)),
+        int(merged.get("pages", 1)),
+    )
+
+async def run_query(
+    scraper: AsyncBingSearchScraper,
+    merged: Dict[str, Any],
+    query_slots: asyncio.Semaphore,
+) -> List[Dict[str, Any]]:
+    """Scrape every page of a single merged query."""
+    term = merged["term"]
+    pages = int(merged.get("pages", 1))
+    results_per_page = int(merged.get("resultsPerPage", scraper.results_per_page))
+    market_code = merged.get("marketCode", scraper.market_code)
+    language_code = merged.get("languageCode", scraper.language_code)
+
+    # Both per-query log lines are skipped outright at the default WARNING
+    # level instead of building their argument tuples for nothing.
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(
+            "Scraping term=%r pages=%d resultsPerPage=%d market=%s lang=%s",
+            term,
+            pages,
+            results_per_page,
+            market_code,
+            language_code,
+        )
+
+    async with query_slots:
+        page_results = await scraper.search(
+            term=term,
+            pages=pages,
+            results_per_page=results_per_page,
+            market_code=market_code,
+            language_code=language_code,
+        )
+
+    if log_info:
+        logger.info(
+            "Collected %d page-level result objects for term %r",
+            len(page_results),
+            term,
+        )
+    return page_results
+
+async def export_queries(
+    scraper: AsyncBingSearchScraper,
+    merged_queries: List[Dict[str, Any]],
+    query_slots: asyncio.Semaphore,
+    ahead: int,
+    write: Callable[[Dict[str, Any]], None],
+) -> None:
+    """
+    Scrape the merged queries and pass their pages to ``write`` in input
+    order. Only ``ahead`` queries are scheduled beyond the one being
+    written, and each query's pages are released once written, so memory
+    stays bounded by that window rather than growing with the run.
+    Identical queries are scraped once; their task is kept until the last
+    input position that uses it has been written.
+    """
+    keyed = [(query_key(merged), merged) for merged in merged_queries]
+    last_use = {key: i for i, (key, _) in enumerate(keyed)}
+    if len(last_use) < len(keyed):
+        logger.info(
+            "Scraping %d unique queries out of %d", len(last_use), len(keyed)
+        )
+
+    live: Dict[Tuple[Any, ...], asyncio.Future] = {}
+    scheduled = 0
+    try:
+        for i, (key, _) in enumerate(keyed):
+            while scheduled < len(keyed) and (scheduled <= i or len(live) < ahead):
+                next_key, merged = keyed[scheduled]
+                if next_key not in live:
+                    live[next_key] = asyncio.ensure_future(
+                        run_query(scraper, merged, query_slots)
+                    )
+                scheduled += 1
+
+            task = live.pop(key) if last_use[key] == i else live[key]
+            pages = await task
+            # Writes run off the event loop so the queries scheduled ahead
+            # keep fetching while this one is exported.
+            await write_pages(write, pages)
+            # Drop this query's pages before waiting on the next one.
+            del task, pages
+    finally:
+        for task in live.values():
+            task.cancel()
+
+async def main_async(args: SimpleNamespace) -> None:
+    # Resolved once here; everything below reuses these absolute paths.
+    settings_path = Path(args.settings).resolve()
+    inputs_path = Path(args.inputs).resolve()
+    output_dir = Path(args.output_dir).resolve()
+
+    logger.info("Loading settings from %s", settings_path)
+    logger.info("Loading input queries from %s", inputs_path)
+    settings, inputs = await asyncio.gather(
+        load_json_file(settings_path), load_json_file(inputs_path)
+    )
+
+    queries: List[Dict[str, Any]] = inputs.get("queries", [])
+    if not queries:
+        logger.error("No queries defined in input file: %s", inputs_path)
+        raise SystemExit(1)
+
+    cfg = _to_settings(settings)
+    defaults = build_query_defaults(cfg)
+    # Reject bad format names before scraping rather than after it.
+    formats = list(dict.fromkeys(fmt.lower() for fmt in args.formats or cfg.formats))
+    unknown = [fmt for fmt in formats if fmt not in KNOWN_FORMATS]
+    if unknown:
+        logger.error("Unknown output formats requested: %s", ", ".join(unknown))
+        raise SystemExit(1)
+
+    include_html = args.include_html or cfg.include_html
+    html_snapshot_dir = None
+    if cfg.html_snapshot_dir:
+        html_snapshot_dir = output_dir / cfg.html_snapshot_dir
+
+    page_cache = None
+    if cfg.cache_enabled and not args.no_cache:
+        page_cache = PageCache(
+            output_dir / cfg.cache_directory,
+            ttl_seconds=cfg.cache_ttl_seconds,
+            max_entries=cfg.cache_max_entries,
+            force_update=args.force_update,
+        )
+
+    softblock_handler = SoftBlockHandler(
+        max_retries=cfg.max_retries,
+        backoff_factor=cfg.backoff_factor,
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info("Exporting results to %s with formats %s", output_dir, formats)
+
+    # One scraper (and so one connection pool) serves every query. Its
+    # semaphore caps the page requests in flight against Bing, while
+    # query_slots caps how many queries are being worked on at once; the
+    # pages of each query are fanned out concurrently inside search().
+    # Pooled connections stay open for keepaliveExpiry seconds, so most
+    # pages skip the DNS lookup and TLS handshake.
+    query_slots = asyncio.Semaphore(cfg.concurrency)
+    with Exporter(output_dir, formats, base_filename="bing_results") as exporter:
+        async with build_async_client(
+            timeout=cfg.timeout,
+            proxy=cfg.proxy,
+            max_connections=cfg.max_inflight_per_host,
+            keepalive_expiry=cfg.keepalive_expiry,
+        ) as client, AsyncBingSearchScraper(
+            market_code=cfg.market_code,
+            language_code=cfg.language_code,
+            results_per_page=cfg.results_per_page,
+            include_html=include_html,
+            softblock_handler=softblock_handler,
+            request_timeout=cfg.timeout,
+            proxy=cfg.proxy,
+            html_snapshot_dir=html_snapshot_dir,
+            page_cache=page_cache,
+            concurrency=cfg.max_inflight_per_host,
+            client=client,
+        ) as scraper:
+            await export_queries(
+                scraper,
+                [merge_query_with_settings(q, defaults) for q in queries],
+                query_slots,
+                ahead=cfg.concurrency,
+                write=exporter.write,
+            )
+
+    if not exporter.count:
+        logger.warning("No results collected. Nothing to export.")
+        return
+
+    logger.info("Scraping and export completed successfully.")
+
+def main() -> None:
+    args = parse_args()
+
+    configure_logging(args.verbose)
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows; use the stdlib event loop there.
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    try:
+        run(main_async(args))
+    except KeyboardInterrupt:
+        logger.warning("Interrupted by user.")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file